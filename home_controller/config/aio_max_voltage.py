@@ -1,10 +1,16 @@
 import os
-import json
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
+
+from home_controller.core import fastjson
 
 DEFAULT_MAX_V = 24.0  # volts, applied to all channels by default
 CHANNELS = [str(i) for i in range(1, 9)]
 
+# Parsed-config cache keyed on file mtime; the files only change on user
+# edits but are loaded from the polling/read paths, so re-parsing per
+# call is wasted work. Maps path -> (st_mtime_ns, parsed dict).
+_AIO_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 
 def get_aio_config_path(module_id: str) -> str:
     base = os.path.dirname(__file__)
@@ -27,19 +33,31 @@ def _with_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def load_aio_max_voltage(module_id: str) -> Dict[str, Any]:
     path = get_aio_config_path(module_id)
-    if not os.path.exists(path):
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
         return _with_defaults({"in": {}, "out": {}})
+    cached = _AIO_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return _with_defaults(raw)
+        with open(path, "rb") as f:
+            raw = fastjson.loads(f.read())
+        data = _with_defaults(raw)
     except Exception:
         return _with_defaults({"in": {}, "out": {}})
+    _AIO_CACHE[path] = (mtime, data)
+    return data
 
 
 def save_aio_max_voltage(module_id: str, data: Dict[str, Any]):
     data = _with_defaults(data)
     path = get_aio_config_path(module_id)
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(fastjson.dumps(data, indent=True))
+    # refresh the cache so the next load skips the disk entirely
+    try:
+        _AIO_CACHE[path] = (os.stat(path).st_mtime_ns, data)
+    except OSError:
+        _AIO_CACHE.pop(path, None)
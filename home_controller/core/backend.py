@@ -17,15 +17,21 @@ ASSUMPTIONS:
     On Raspberry Pi this is typically /dev/i2c-1 (bus_num = 1).
 """
 
+import atexit
+import copy
+import functools
 import json
 import os
+import queue
+import re
 import shutil
+import threading
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import datetime
-from home_controller.core import i2c_catalog
+from home_controller.core import fastjson, i2c_catalog
 from home_controller.config import aio_max_voltage
 try:
     from home_controller.core.backend_core import RS485Backend, RS485NotReady
@@ -47,6 +53,12 @@ except Exception:
 # -----------------------------
 
 DEFAULT_I2C_BUS_NUM = 1  # fixed bus (Pi SDA/SCL)
+AIO_READ_LEN = 128  # max ASCII CSV response bytes from an AIO module
+
+# Pure functions of __file__; computed once at import instead of per
+# backend construction. backend.py lives in home_controller/core/.
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+_DEFAULT_CONFIG_PATH = os.path.join(_REPO_ROOT, "home_controller", "config", "config.json")
 
 VALID_TYPES = ("di", "do", "aio", "i2c", "rs485", "Generator")  # 'i2c' is I2C Module
 
@@ -59,12 +71,71 @@ MCP23017_MAX = 0x27
 AIO_BASE = 0x30
 AIO_MAX = 0x37
 
+# Allowed address sets per module type, precomputed for O(1) membership
+# checks; extending to new chip families is one entry here.
+_ALLOWED_ADDRS: Dict[str, frozenset] = {
+    "di": frozenset(range(MCP23017_MIN, MCP23017_MAX + 1)),
+    "do": frozenset(range(MCP23017_MIN, MCP23017_MAX + 1)),
+    "aio": frozenset(range(AIO_BASE, AIO_MAX + 1)),
+}
+
+# normalize_address fast path: every valid 7-bit address in its common
+# spellings ("21", "0x21", "5", "0x05", ...), precomputed once at import.
+_ADDR_LUT: Dict[str, Tuple[str, int]] = {}
+for _v in range(0x80):
+    _hit = (f"0x{_v:02x}", _v)
+    for _s in (f"{_v:x}", f"{_v:02x}", f"0x{_v:x}", f"0x{_v:02x}"):
+        _ADDR_LUT[_s] = _hit
+del _v, _hit, _s
+
+
+# Precomputed byte -> 8 channel-flag tuples plus string channel keys, so
+# unpacking a port byte is one table index + dict(zip(...)) at C speed
+# instead of a Python-level bit loop on every poll.
+_BYTE_TO_BITS = tuple(tuple((b >> i) & 1 for i in range(8)) for b in range(256))
+
+# Number token for the ASCII CSV the AIO modules return; matched per
+# comma-separated field so a corrupt field (frames are decoded with
+# errors="ignore") becomes NaN instead of shifting later channels down
+_CSV_NUM = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+def _parse_csv_floats(s: str) -> List[float]:
+    if not s:
+        return []
+    out: List[float] = []
+    for tok in s.split(","):
+        m = _CSV_NUM.fullmatch(tok.strip())
+        out.append(float(m.group()) if m else float("nan"))
+    return out
+_CH_KEYS_A = tuple(str(i + 1) for i in range(8))
+_CH_KEYS_B = tuple(str(i + 9) for i in range(8))
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_chans(tpl: Tuple[float, ...]) -> str:
+    """CSV display string for a channel tuple; memoized because the UI
+    writes one channel at a time, so consecutive tuples mostly repeat."""
+    return ",".join(str(v) for v in tpl)
+
+
+def _unpack_channels(a: int, b: int) -> Dict[str, int]:
+    """Map GPIOA/GPIOB bytes to the UI's 1-16 channel flag dict."""
+    out = dict(zip(_CH_KEYS_A, _BYTE_TO_BITS[a & 0xFF]))
+    out.update(zip(_CH_KEYS_B, _BYTE_TO_BITS[b & 0xFF]))
+    return out
+
+
+def _unpack_bitmap16(bm: int) -> Dict[str, int]:
+    """Map a 16-bit channel bitmap to the UI's 1-16 channel flag dict."""
+    return _unpack_channels(bm & 0xFF, (bm >> 8) & 0xFF)
+
 
 # -----------------------------
 # Data model
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ModuleEntry:
     """
     A configured module. For v0 this is just type + address.
@@ -80,8 +151,18 @@ class ModuleEntry:
     def address_int(self) -> int:
         return int(self.address_hex, 16)
 
+    def to_dict(self) -> Dict[str, Any]:
+        # flat dict literal; avoids the recursive traversal dataclasses.asdict does
+        return {
+            "id": self.id,
+            "type": self.type,
+            "address_hex": self.address_hex,
+            "name": self.name,
+            "module_num": self.module_num,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ControllerConfig:
     controller_name: str = "Home Controller"
     notes: str = ""
@@ -162,34 +243,104 @@ class HomeControllerBackend:
 
     def load_module_config(self, mtype: str, address_hex: str) -> dict:
         path = self._module_config_path(mtype, address_hex)
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except OSError:
             return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        cached = self._modcfg_cache.get(path)
+        if cached is not None and (cached[0], cached[1]) == (st.st_mtime_ns, st.st_size):
+            # deep copy so callers can mutate freely before saving back
+            return copy.deepcopy(cached[2])
+        with open(path, "rb") as f:
+            data = fastjson.loads(f.read())
+        self._modcfg_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
 
     def save_module_config(self, mtype: str, address_hex: str, data: dict) -> None:
         path = self._module_config_path(mtype, address_hex)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        with open(path, "wb") as f:
+            f.write(fastjson.dumps(data, indent=True, sort_keys=True))
+        # refresh the memo so the next load skips the read + parse
+        try:
+            st = os.stat(path)
+            self._modcfg_cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+        except OSError:
+            self._modcfg_cache.pop(path, None)
 
     def __init__(self, config_path: Optional[str] = None) -> None:
         self._repo_root = self._find_repo_root()
-        self._config_path = config_path or os.path.join(
-            self._repo_root, "home_controller", "config", "config.json"
-        )
+        self._config_path = config_path or _DEFAULT_CONFIG_PATH
+        self._alert_log_path = os.path.join(self._repo_root, "home_controller", "config", "aio_alerts.log")
         # bounded logging helpers
         self._module_log_enabled: bool = True
         # dev_mode and dev_file may be set by the caller to simulate I2C
         self._dev_mode = False
         self._dev_file: Optional[str] = None
         self._dev_data: Dict[str, Any] = {}
+        # debounced dev-file writer state
+        self._dev_save_lock = threading.Lock()
+        self._dev_dirty = False
+        self._dev_flush_timer: Optional[threading.Timer] = None
         self._last_errors: Dict[str, str] = {}
         self._manual_errors_by_num: Dict[int, str] = {}
+        # last save_config payload + resulting mtime, so load_config can
+        # skip disk entirely when the file has not changed since we wrote it
+        self._last_saved_raw: Optional[Dict[str, Any]] = None
+        self._last_saved_mtime_ns: Optional[int] = None
+        # payload (minus saved_at) from the last write, to skip no-op saves
+        self._last_payload: Optional[Dict[str, Any]] = None
+        # per-module config memo: path -> (mtime_ns, size, parsed dict)
+        self._modcfg_cache: Dict[str, Tuple[int, int, dict]] = {}
+        # long-lived SMBus handles (opened lazily, one per bus number)
+        self._buses: Dict[int, Any] = {}
+        self._bus_locks: Dict[int, threading.Lock] = {}
+        # MCP23017 shadow registers (address_hex -> {reg: value}); the
+        # controller is the only writer on the bus, so OLAT/IODIR can be
+        # mirrored in RAM to skip the read half of read-modify-write.
+        self._mcp_shadow: Dict[str, Dict[int, int]] = {}
+        # (st_mtime_ns, st_size) of the file backing self.cfg, so repeat
+        # load_config calls return the cached object after one os.stat
+        self._cfg_stat: Optional[Tuple[int, int]] = None
+        self._cfg_lock = threading.RLock()
 
         self.cfg = self.load_config()
         # Force modules to use the fixed modules I2C bus (ensure modules are always on i2c1)
         self.cfg.i2c_bus_num = DEFAULT_I2C_BUS_NUM
+        # id -> index map so module lookup is O(1); rebuilt on any mutation
+        self._id_index: Dict[str, int] = {}
+        self._rebuild_module_index()
+        # id -> serialized entry, kept fresh by the mutators so save_config
+        # only re-materializes the modules that actually changed
+        self._modules_payload: Dict[str, Dict[str, Any]] = {m.id: m.to_dict() for m in self.cfg.modules}
+        # seed the no-op-save comparison with the loaded state; otherwise
+        # the atexit flush would rewrite config.json (and clobber the
+        # .bak) on every clean exit even with zero mutations
+        self._last_payload = self._config_payload()
+        # cached list_modules() tuple; None until first use or after add/remove
+        self._modules_view: Optional[Tuple[ModuleEntry, ...]] = None
+        # type -> RS485 reader; read_module dispatches here instead of an
+        # if/elif cascade over every type
+        self._rs485_readers: Dict[str, Any] = {
+            "di": self._read_di_rs485,
+            "do": self._read_do_rs485,
+            "aio": self._read_aio_rs485,
+            "Generator": self._read_gen_rs485,
+            "i2c": self._read_i2cmod_rs485,
+        }
+
+        # Background config saver: mutators enqueue a save request instead of
+        # blocking the HTTP handler on disk I/O. maxsize=1 coalesces bursts
+        # (a pending save always serializes the latest state). A flush is
+        # registered at exit so a queued save is not lost on clean shutdown;
+        # save_config itself skips no-op writes, so the flush is cheap.
+        self._save_q: "queue.Queue[None]" = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(
+            target=self._save_worker, name="hc-config-saver", daemon=True
+        )
+        self._save_thread.start()
+        atexit.register(self.save_config)
+        atexit.register(self._flush_dev_data)
 
         # Optional RS485 transport (for *_core.ino firmwares)
         self.rs485: Optional[RS485Backend] = None
@@ -234,24 +385,43 @@ class HomeControllerBackend:
                 return {}
             if not os.path.exists(self._dev_file):
                 return {}
-            with open(self._dev_file, "r", encoding="utf-8") as f:
-                raw = json.load(f) or {}
-            # normalize keys to lowercase hex strings
-            out: Dict[str, Any] = {}
-            for k, v in raw.items():
-                out[str(k).lower()] = v
-            return out
+            with open(self._dev_file, "rb") as f:
+                raw = fastjson.loads(f.read()) or {}
+            # keys are written lowercased, so the normalization pass only
+            # runs for hand-edited files with mixed-case addresses
+            if any(k != k.lower() for k in raw):
+                raw = {str(k).lower(): v for k, v in raw.items()}
+            return raw
         except Exception:
             return {}
 
-    def _save_dev_data(self) -> None:
+    def _schedule_dev_save(self, delay: float = 0.25) -> None:
+        """Coalesce dev-file writes: N rapid channel toggles -> one rewrite."""
+        with self._dev_save_lock:
+            self._dev_dirty = True
+            if self._dev_flush_timer is not None:
+                self._dev_flush_timer.cancel()
+            t = threading.Timer(delay, self._flush_dev_data)
+            t.daemon = True
+            self._dev_flush_timer = t
+            t.start()
+
+    def _flush_dev_data(self) -> None:
+        with self._dev_save_lock:
+            if not self._dev_dirty:
+                return
+            self._dev_dirty = False
+            self._dev_flush_timer = None
+        self._save_dev_data_now()
+
+    def _save_dev_data_now(self) -> None:
         try:
             if not self._dev_file:
                 return
             os.makedirs(os.path.dirname(self._dev_file), exist_ok=True)
             tmp = self._dev_file + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self._dev_data, f, indent=2, sort_keys=True)
+            with open(tmp, "wb") as f:
+                f.write(fastjson.dumps(self._dev_data, indent=True, sort_keys=True))
             os.replace(tmp, self._dev_file)
         except Exception:
             pass
@@ -262,7 +432,7 @@ class HomeControllerBackend:
 
     def _find_repo_root(self) -> str:
         # backend.py is in home_controller/core/ -> go up two levels
-        return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+        return _REPO_ROOT
 
     @property
     def config_path(self) -> str:
@@ -272,6 +442,28 @@ class HomeControllerBackend:
     # Config I/O
     # --------
 
+    @staticmethod
+    def _config_from_raw(raw: Dict[str, Any]) -> ControllerConfig:
+        modules: List[ModuleEntry] = []
+        for m in raw.get("modules", []):
+            try:
+                modules.append(ModuleEntry(
+                    id=str(m["id"]),
+                    type=str(m["type"]).lower(),
+                    address_hex=str(m["address_hex"]).strip().lower(),
+                    name=str(m.get("name", "")),
+                    module_num=int(m["module_num"]) if "module_num" in m and m["module_num"] is not None else None,
+                ))
+            except Exception:
+                continue  # skip malformed entries
+
+        return ControllerConfig(
+            controller_name=str(raw.get("controller_name", "Home Controller")),
+            notes=str(raw.get("notes", "")),
+            i2c_bus_num=int(raw.get("i2c_bus_num", DEFAULT_I2C_BUS_NUM)),
+            modules=modules,
+        )
+
     def load_config(self) -> ControllerConfig:
         """
         Load config; fall back to .bak if the primary is missing/corrupt.
@@ -279,32 +471,34 @@ class HomeControllerBackend:
         subsequent saves do not discard it.
         """
         def _load(path: str) -> ControllerConfig:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f) or {}
-
-            modules: List[ModuleEntry] = []
-            for m in raw.get("modules", []):
-                try:
-                    modules.append(ModuleEntry(
-                        id=str(m["id"]),
-                        type=str(m["type"]).lower(),
-                        address_hex=str(m["address_hex"]).lower(),
-                        name=str(m.get("name", "")),
-                        module_num=int(m["module_num"]) if "module_num" in m and m["module_num"] is not None else None,
-                    ))
-                except Exception:
-                    continue  # skip malformed entries
-
-            return ControllerConfig(
-                controller_name=str(raw.get("controller_name", "Home Controller")),
-                notes=str(raw.get("notes", "")),
-                i2c_bus_num=int(raw.get("i2c_bus_num", DEFAULT_I2C_BUS_NUM)),
-                modules=modules,
-            )
+            with open(path, "rb") as f:
+                raw = fastjson.loads(f.read()) or {}
+            return self._config_from_raw(raw)
 
         primary = self._config_path
         backup = self._config_path + ".bak"
 
+        # Fast path: return the already-parsed config while the file on
+        # disk is unchanged (one stat instead of a read + JSON parse).
+        with self._cfg_lock:
+            cached = getattr(self, "cfg", None)
+            if cached is not None and self._cfg_stat is not None:
+                try:
+                    st = os.stat(primary)
+                    if (st.st_mtime_ns, st.st_size) == self._cfg_stat:
+                        return cached
+                except OSError:
+                    pass
+
+            # Next best: the file is exactly what we last wrote; rebuild
+            # from the cached payload without touching the disk.
+            if self._last_saved_raw is not None:
+                try:
+                    if os.stat(primary).st_mtime_ns == self._last_saved_mtime_ns:
+                        return self._config_from_raw(self._last_saved_raw)
+                except OSError:
+                    pass
+
         # If a stale tmp exists from a crash, delete it (never trusted)
         tmp = self._config_path + ".tmp"
         try:
@@ -314,27 +508,65 @@ class HomeControllerBackend:
             pass
 
         # Try primary, then backup
-        used_backup = False
         if os.path.exists(primary):
             try:
-                return _load(primary)
+                st = os.stat(primary)
+                cfg = _load(primary)
+                with self._cfg_lock:
+                    self._adopt_config(cfg)
+                    self._cfg_stat = (st.st_mtime_ns, st.st_size)
+                return cfg
             except Exception:
                 pass
         if os.path.exists(backup):
             try:
                 cfg = _load(backup)
-                used_backup = True
                 # restore backup to primary so future saves start from it
                 try:
                     shutil.copy2(backup, primary)
                 except Exception:
                     pass
+                with self._cfg_lock:
+                    self._adopt_config(cfg)
+                    self._cfg_stat = None
                 return cfg
             except Exception:
                 pass
 
         return ControllerConfig()
 
+    def _adopt_config(self, cfg: ControllerConfig) -> None:
+        """Make a freshly parsed config the live one.
+
+        The stat fast path above returns self.cfg, so a fresh parse
+        (e.g. after an external edit to config.json) must replace it and
+        refresh the derived caches — otherwise the next call would match
+        the new stat but hand back the stale pre-edit object. No-op
+        guards cover the first call from __init__, before the derived
+        state exists.
+        """
+        self.cfg = cfg
+        cfg.i2c_bus_num = DEFAULT_I2C_BUS_NUM
+        if hasattr(self, "_id_index"):
+            self._rebuild_module_index()
+        if hasattr(self, "_modules_payload"):
+            self._modules_payload = {m.id: m.to_dict() for m in cfg.modules}
+            self._modules_view = None
+            self._last_payload = self._config_payload()
+
+    def _config_payload(self) -> Dict[str, Any]:
+        """Serializable config state minus saved_at; the form compared
+        against _last_payload to skip no-op writes."""
+        return {
+            "controller_name": self.cfg.controller_name,
+            "notes": self.cfg.notes,
+            "i2c_bus_num": self.cfg.i2c_bus_num,
+            "modules": [
+                self._modules_payload.get(m.id) or self._modules_payload.setdefault(m.id, m.to_dict())
+                for m in self.cfg.modules
+            ],
+        }
+
     def save_config(self) -> None:
         """
         Persist config atomically to avoid losing modules after a crash.
@@ -344,25 +576,36 @@ class HomeControllerBackend:
         3) Replace primary with tmp (atomic on POSIX).
         """
         os.makedirs(os.path.dirname(self._config_path), exist_ok=True)
-        raw: Dict[str, Any] = {
-            "controller_name": self.cfg.controller_name,
-            "notes": self.cfg.notes,
-            "i2c_bus_num": self.cfg.i2c_bus_num,
-            "modules": [asdict(m) for m in self.cfg.modules],
-            "saved_at": int(time.time()),
-        }
-        tmp = self._config_path + ".tmp"
-        bak = self._config_path + ".bak"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(raw, f, indent=2, sort_keys=True)
-            f.flush()
-            os.fsync(f.fileno())
-        if os.path.exists(self._config_path):
+        # Serialized under _cfg_lock: the background saver thread and direct
+        # callers (atexit flush) share the same .tmp path.
+        with self._cfg_lock:
+            payload = self._config_payload()
+            # saved_at changes on every call, so compare without it and skip
+            # the disk write (and the mtime churn) when nothing else changed
+            if payload == self._last_payload:
+                return
+            raw: Dict[str, Any] = dict(payload)
+            raw["saved_at"] = int(time.time())
+            tmp = self._config_path + ".tmp"
+            bak = self._config_path + ".bak"
+            # No fsync here: os.replace is atomic, and the .bak copy below plus
+            # load_config's backup fallback already cover the crash case.
+            with open(tmp, "wb") as f:
+                f.write(fastjson.dumps(raw, indent=True, sort_keys=True))
+            if os.path.exists(self._config_path):
+                try:
+                    shutil.copy2(self._config_path, bak)
+                except Exception:
+                    pass
+            os.replace(tmp, self._config_path)
+            self._last_saved_raw = raw
+            self._last_payload = payload
             try:
-                shutil.copy2(self._config_path, bak)
-            except Exception:
-                pass
-        os.replace(tmp, self._config_path)
+                st = os.stat(self._config_path)
+                self._last_saved_mtime_ns = st.st_mtime_ns
+                self._cfg_stat = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self._last_saved_mtime_ns = None
 
     # --------
     # Helpers
@@ -377,6 +620,11 @@ class HomeControllerBackend:
         if not s:
             raise ValueError("Address is blank")
 
+        hit = _ADDR_LUT.get(s)
+        if hit is not None:
+            return hit
+
+        # slow path for unusual spellings (e.g. zero-padded "0021")
         if s.startswith("0x"):
             val = int(s, 16)
         else:
@@ -386,7 +634,9 @@ class HomeControllerBackend:
         if val < 0 or val > 0x7F:
             raise ValueError(f"I2C address out of range: {addr}")
 
-        return f"0x{val:02x}", val
+        # canonical spelling comes from the table, so the format string
+        # only ever ran at import time
+        return _ADDR_LUT[f"{val:x}"]
 
     # --------
     # AIO scaling helpers
@@ -455,11 +705,57 @@ class HomeControllerBackend:
             return f"rs485-{address_hex.lower()}"
         return f"i2c{DEFAULT_I2C_BUS_NUM}-{address_hex.lower()}"
 
+    # -----------------------------
+    # I2C bus handles (legacy direct-I2C path)
+    # -----------------------------
+    def _bus_lock(self, bus_num: int) -> threading.Lock:
+        lock = self._bus_locks.get(bus_num)
+        if lock is None:
+            lock = self._bus_locks.setdefault(bus_num, threading.Lock())
+        return lock
+
+    def _get_bus(self, bus_num: int):
+        """Long-lived SMBus handle for bus_num (caller holds _bus_lock)."""
+        bus = self._buses.get(bus_num)
+        if bus is None:
+            bus = smbus2.SMBus(bus_num)
+            self._buses[bus_num] = bus
+        return bus
+
+    def _drop_bus(self, bus_num: int) -> None:
+        """Close and evict a handle after an I/O error so next use re-opens."""
+        bus = self._buses.pop(bus_num, None)
+        if bus is not None:
+            try:
+                bus.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        for bus_num in list(self._buses):
+            self._drop_bus(bus_num)
+
+    def _rebuild_module_index(self) -> None:
+        self._id_index = {m.id.lower(): i for i, m in enumerate(self.cfg.modules)}
+
+    def _save_worker(self) -> None:
+        while True:
+            self._save_q.get()
+            try:
+                self.save_config()
+            except Exception:
+                # a failed background save must never kill the worker
+                pass
+
+    def _request_save(self) -> None:
+        """Queue an asynchronous save_config; coalesces when one is pending."""
+        try:
+            self._save_q.put_nowait(None)
+        except queue.Full:
+            pass
+
     def _find_module_index(self, mid: str) -> int:
-        for i, m in enumerate(self.cfg.modules):
-            if m.id.lower() == mid.lower():
-                return i
-        return -1
+        return self._id_index.get(mid.lower(), -1)
 
     def _set_last_error(self, module_id: str, err: Optional[str]) -> None:
         if err:
@@ -539,8 +835,14 @@ class HomeControllerBackend:
     # Public API
     # --------
 
-    def list_modules(self) -> List[ModuleEntry]:
-        return list(self.cfg.modules)
+    def list_modules(self) -> Tuple[ModuleEntry, ...]:
+        # immutable view; cached because the polling loop calls this far
+        # more often than membership changes. Entries mutate in place
+        # (rename etc.), so only add/remove invalidates the tuple.
+        view = self._modules_view
+        if view is None:
+            view = self._modules_view = tuple(self.cfg.modules)
+        return view
 
     def add_module(self, mtype: str, address: str, name: str = "") -> ModuleEntry:
         mtype = mtype.strip().lower()
@@ -554,12 +856,10 @@ class HomeControllerBackend:
             raise ValueError(f"Module already exists: {mid}")
         entry = ModuleEntry(id=mid, type=mtype, address_hex=address_hex, name=name.strip())
         self.cfg.modules.append(entry)
-        self.save_config()
-        return entry
-
-        entry = ModuleEntry(id=mid, type=mtype, address_hex=address_hex, name=name.strip())
-        self.cfg.modules.append(entry)
-        self.save_config()
+        self._id_index[entry.id.lower()] = len(self.cfg.modules) - 1
+        self._modules_view = None
+        self._modules_payload[entry.id] = entry.to_dict()
+        self._request_save()
         return entry
 
     def remove_module(self, module_id: str) -> None:
@@ -567,16 +867,21 @@ class HomeControllerBackend:
         idx = self._find_module_index(mid)
         if idx < 0:
             raise ValueError(f"Module not found: {mid}")
-        self.cfg.modules.pop(idx)
-        self.save_config()
+        removed = self.cfg.modules.pop(idx)
+        self._modules_view = None
+        self._modules_payload.pop(removed.id, None)
+        self._rebuild_module_index()
+        self._request_save()
 
     def rename_module(self, module_id: str, new_name: str) -> None:
         mid = module_id.strip()
         idx = self._find_module_index(mid)
         if idx < 0:
             raise ValueError(f"Module not found: {mid}")
-        self.cfg.modules[idx].name = new_name.strip()
-        self.save_config()
+        m = self.cfg.modules[idx]
+        m.name = new_name.strip()
+        self._modules_payload[m.id] = m.to_dict()
+        self._request_save()
 
     def change_module_address(self, module_id: str, new_address: str) -> ModuleEntry:
         """
@@ -595,12 +900,11 @@ class HomeControllerBackend:
         address_hex, address_int = self.normalize_address(new_address)
 
         # type-specific guardrails
-        if m.type in ("di", "do"):
-            if not (MCP23017_MIN <= address_int <= MCP23017_MAX):
+        allowed = _ALLOWED_ADDRS.get(m.type)
+        if allowed is not None and address_int not in allowed:
+            if m.type in ("di", "do"):
                 raise ValueError("DI/DO addresses must be in 0x20–0x27 (MCP23017 default range)")
-        if m.type == "aio":
-            if not (AIO_BASE <= address_int <= AIO_MAX):
-                raise ValueError("AIO addresses must be in 0x30–0x37 (AIO base + 3 DIP bits)")
+            raise ValueError("AIO addresses must be in 0x30–0x37 (AIO base + 3 DIP bits)")
 
         new_mid = self._module_id(address_hex, m.type)
         # ensure we won't collide with another module
@@ -608,10 +912,13 @@ class HomeControllerBackend:
         if existing >= 0 and existing != idx:
             raise ValueError(f"Another module already uses address {address_hex}")
 
-        # update module entry
+        # update module entry (cache key follows the id change)
+        self._modules_payload.pop(m.id, None)
         m.address_hex = address_hex
         m.id = new_mid
-        self.save_config()
+        self._modules_payload[m.id] = m.to_dict()
+        self._rebuild_module_index()
+        self._request_save()
         return m
 
     def set_module_number(self, module_id: str, module_num: Optional[int]) -> ModuleEntry:
@@ -628,15 +935,336 @@ class HomeControllerBackend:
             # If another module already uses this number, clear it (allow reorder swaps)
             for i, m in enumerate(self.cfg.modules):
                 if i != idx and m.module_num == module_num:
-                    self.cfg.modules[i].module_num = None
-        self.cfg.modules[idx].module_num = module_num
-        self.save_config()
-        return self.cfg.modules[idx]
+                    m.module_num = None
+                    self._modules_payload[m.id] = m.to_dict()
+        target = self.cfg.modules[idx]
+        target.module_num = module_num
+        self._modules_payload[target.id] = target.to_dict()
+        self._request_save()
+        return target
 
     # -----------------------------
     # Module-specific I2C reads
     # -----------------------------
 
+    # --------
+    # Per-type readers (dispatched from read_module)
+    # --------
+    def _read_dev(self, m: ModuleEntry, module_id: str) -> Optional[Dict[str, Any]]:
+        """Simulated read from the dev file; None when no compatible entry exists."""
+        dev = self._dev_data.get(m.address_hex.lower())
+        # fallback: if no exact match, try to find a compatible dev entry
+        if dev is None:
+            for k, v in self._dev_data.items():
+                if not isinstance(v, dict):
+                    continue
+                # AIO entries typically contain 'channels' or 'raw_response'
+                if m.type == 'aio' and ('raw_response' in v or 'channels' in v):
+                    dev = v
+                    break
+                # DI/DO entries typically contain gpio_a/gpio_b
+                if m.type in ('di', 'do') and ('gpio_a' in v or 'gpio_b' in v):
+                    dev = v
+                    break
+
+        if dev is not None:
+            self._set_last_error(module_id, None)
+            # DI/DO simulated via gpio_a/gpio_b or explicit channels
+            if m.type in ("di", "do"):
+                a = int(dev.get("gpio_a", 0))
+                b = int(dev.get("gpio_b", 0))
+                channels = _unpack_channels(a, b)
+                return {
+                    "ok": True,
+                    "comms_ok": True,
+                    "module_id": m.id,
+                    "type": m.type,
+                    "address": m.address_hex,
+                    "ports": {"gpio_a": a, "gpio_b": b},
+                    "channels": channels,
+                    "power": self._sense_info(None, two_lines=True),
+                }
+            elif m.type == "aio":
+                # AIO simulated via channels list or raw_response
+                if "raw_response" in dev:
+                    s = str(dev.get("raw_response", ""))
+                    values: List[float] = _parse_csv_floats(s)
+                else:
+                    vals = dev.get("channels", [])
+                    values = [float(v) for v in vals]
+
+                channels = dict(zip(_CH_KEYS_A, values))
+
+                return {
+                    "ok": True,
+                    "comms_ok": True,
+                    "module_id": m.id,
+                    "type": m.type,
+                    "address": m.address_hex,
+                    "raw_response": dev.get("raw_response", _fmt_chans(tuple(values))),
+                    "channels": channels,
+                    "power": self._sense_info(None, two_lines=True),
+                    "comms_led": "green",
+                }
+        return None
+
+    def _read_di_rs485(self, m: ModuleEntry, module_id: str) -> Dict[str, Any]:
+        """DI over RS485: 16-bit input bitmap plus sense/power info."""
+        addr_int = m.address_int()
+        res = self.rs485.read_di_bitmap(addr_int)
+        if res.get("ok"):
+            self._set_last_error(module_id, None)
+            bm = int(res.get("bitmap", 0))
+            channels = _unpack_bitmap16(bm)
+            return {
+                "ok": True,
+                "comms_ok": True,
+                "module_id": m.id,
+                "type": m.type,
+                "address": m.address_hex,
+                "bitmap": bm,
+                "sense_mask": res.get("sense_mask"),
+                "power": self._sense_info(res.get("sense_mask"), two_lines=True),
+                "comms_led": "green",
+                "channels": channels,
+                "raw": {
+                    "lo": res.get("raw_lo"),
+                    "hi": res.get("raw_hi"),
+                },
+            }
+        else:
+            self._log_module_error(m.type, m.id, m.address_hex, res.get("error", "DI RS485 read failed"), res.get("raw"))
+            return res
+
+    def _read_aio_rs485(self, m: ModuleEntry, module_id: str) -> Dict[str, Any]:
+        """AIO over RS485: per-channel voltages with over-voltage alerts."""
+        addr_int = m.address_int()
+        channels: Dict[str, float] = {}
+        raw_frames: Dict[str, str] = {}
+        sense_mask = None
+        alerts = []
+        # Per-channel over-voltage thresholds, built once per scan
+        # (inf = unset, so the comparison below never needs a None check)
+        max_in = aio_max_voltage.load_aio_max_voltage(m.id).get("in", {})
+        thresholds = []
+        for c in range(1, 9):
+            try:
+                thresholds.append(float(max_in.get(str(c), "inf")))
+            except Exception:
+                thresholds.append(float("inf"))
+        # Read AI channels 0..7 (presented as 1..8 to UI)
+        for ch in range(8):
+            r = self.rs485.read_aio_channel(addr_int, ch)
+            if not r.get("ok"):
+                self._set_last_error(module_id, r.get("error") or "AIO RS485 read failed")
+                self._log_module_error(m.type, m.id, m.address_hex, r.get("error", "AIO RS485 read failed"), r.get("raw"))
+                return r
+            v12 = int(r.get("value12", 0))
+            if sense_mask is None:
+                sense_mask = r.get("sense_mask")
+            raw_frames[str(ch + 1)] = r.get("raw", b"").hex() if isinstance(r.get("raw"), (bytes, bytearray)) else ""
+            v = self._counts_to_voltage(v12, m.id, ch + 1, direction="in")
+            channels[str(ch + 1)] = v
+            maxv = thresholds[ch]
+            if v is not None and v > maxv:
+                alerts.append({
+                    "module": m.id,
+                    "address": m.address_hex,
+                    "channel": ch + 1,
+                    "max_voltage": maxv,
+                    "measured_voltage": v,
+                    "timestamp": int(time.time()),
+                })
+        return {
+            "ok": True,
+            "comms_ok": True,
+            "module_id": m.id,
+            "type": m.type,
+            "address": m.address_hex,
+            "channels": channels,
+            "sense_mask": sense_mask,
+            "power": self._sense_info(sense_mask, two_lines=True),
+            "comms_led": "green",
+            "raw_frames": raw_frames,
+            "alerts": alerts,
+        }
+
+    def _read_do_rs485(self, m: ModuleEntry, module_id: str) -> Dict[str, Any]:
+        """DO over RS485: 16-bit output bitmap plus sense/power info."""
+        addr_int = m.address_int()
+        res = self.rs485.read_do_bitmap(addr_int)
+        if res.get("ok"):
+            self._set_last_error(module_id, None)
+            bm = int(res.get("bitmap", 0))
+            channels = _unpack_bitmap16(bm)
+            return {
+                "ok": True,
+                "comms_ok": True,
+                "module_id": m.id,
+                "type": m.type,
+                "address": m.address_hex,
+                "bitmap": bm,
+                "sense_mask": res.get("sense_mask"),
+                "power": self._sense_info(res.get("sense_mask"), two_lines=True),
+                "comms_led": "green",
+                "channels": channels,
+                "raw": {
+                    "lo": res.get("raw_lo"),
+                    "hi": res.get("raw_hi"),
+                },
+            }
+        else:
+            self._set_last_error(module_id, res.get("error", "DO RS485 read failed"))
+            self._log_module_error(m.type, m.id, m.address_hex, res.get("error", "DO RS485 read failed"), res.get("raw"))
+            return res
+
+    def _read_gen_rs485(self, m: ModuleEntry, module_id: str) -> Dict[str, Any]:
+        """Generator over RS485: telemetry snapshot mapped to UI fields."""
+        addr_int = m.address_int()
+        snap = self.rs485.gen_snapshot(addr_int, trace_logger=self._log_gen_serial)
+        if not snap.get("ok"):
+            self._set_last_error(module_id, snap.get("error", "Gen RS485 read failed"))
+            self._log_module_error(m.type, m.id, m.address_hex, snap.get("error", "Gen RS485 read failed"), snap.get("raw"))
+            return {"ok": False, "error": snap.get("error", "Gen RS485 read failed")}
+        t = snap["telem"]
+        telem = {
+            "uptime_s": t["uptime_s"],
+            "battery_v": round(t["batt_mv"] / 1000.0, 3),
+            "temp_c": round(t["eng_temp_c_x10"] / 10.0, 1),
+            "gen_v_l1": round(t["gen_v_l1_x10"] / 10.0, 1),
+            "gen_v_l2": round(t["gen_v_l2_x10"] / 10.0, 1),
+            "util_v_l1": round(t["util_v_l1_x10"] / 10.0, 1),
+            "util_v_l2": round(t["util_v_l2_x10"] / 10.0, 1),
+            "amps_l1": round(t["amps_l1_x100"] / 100.0, 2),
+            "amps_l2": round(t["amps_l2_x100"] / 100.0, 2),
+            "hz": round(t["hz_x100"] / 100.0, 2),
+            "rpm": int(t["rpm"]),
+            "run_seconds": int(t["run_seconds"]),
+            "alarm_code": int(t["alarm_code"]),
+            "warn_code": int(t["warn_code"]),
+            "state": int(t["state"]),
+            "mode": int(t["mode"]),
+            "flags": int(t["flags"]),
+            "poll_ms": int(t["poll_ms"]),
+            "good_frames": int(t["good_frames"]),
+            "bad_frames": int(t["bad_frames"]),
+        }
+        state_map = {
+            0: "UNKNOWN",
+            1: "STOPPED",
+            2: "STARTING",
+            3: "RUNNING",
+            4: "COOLDOWN",
+            5: "EXERCISE",
+            6: "ALARM",
+            7: "WARNING",
+        }
+        mode_map = {0: "UNKNOWN", 1: "OFF", 2: "AUTO", 3: "MANUAL"}
+        telem["run_state"] = state_map.get(telem["state"], "UNKNOWN")
+        telem["mode_name"] = mode_map.get(telem["mode"], "UNKNOWN")
+        running = telem["rpm"] > 0 or telem["state"] == 3
+        self._set_last_error(module_id, None)
+        return {
+            "ok": True,
+            "comms_ok": True,
+            "module_id": m.id,
+            "type": m.type,
+            "address": m.address_hex,
+            "running": running,
+            "run_state": telem["run_state"],
+            "mode": telem["mode_name"],
+            "rpm": telem["rpm"],
+            "hz": telem["hz"],
+            "battery_v": telem["battery_v"],
+            "temp_c": telem["temp_c"],
+            "gen_v_l1": telem["gen_v_l1"],
+            "gen_v_l2": telem["gen_v_l2"],
+            "util_v_l1": telem["util_v_l1"],
+            "util_v_l2": telem["util_v_l2"],
+            "amps_l1": telem["amps_l1"],
+            "amps_l2": telem["amps_l2"],
+            "alarm_code": telem["alarm_code"],
+            "warn_code": telem["warn_code"],
+            "raw_telem": telem,
+        }
+
+    def _read_i2cmod_rs485(self, m: ModuleEntry, module_id: str) -> Dict[str, Any]:
+        """I2C expander over RS485: registry, samples and a quick scan."""
+        addr_int = m.address_int()
+        CMD_SCAN_I2C = 0x05
+        CMD_LIST_REGISTERED = 0x09
+        CMD_SAMPLE_ALL = 0x08
+        # 1) list registered devices
+        lst = self.rs485.send_i2c_cmd_multi(addr_int, CMD_LIST_REGISTERED, 0, 0, timeout=0.8)
+        if not lst.get("ok"):
+            self._set_last_error(module_id, lst.get("error", "I2C module RS485 list failed"))
+            self._log_module_error(m.type, m.id, m.address_hex, lst.get("error", "I2C module RS485 list failed"), lst.get("raw"))
+            return {"ok": False, "error": lst.get("error", "I2C module RS485 list failed")}
+        devices = []
+        for f in lst["frames"]:
+            if not f.get("ok"):
+                continue
+            if f.get("field") == 0x11 and f.get("status") == 0:  # FIELD_REGISTRY_ENTRY
+                devices.append(
+                    {
+                        "sensor_type": f.get("sensor_type"),
+                        "i2c_addr": f.get("i2c_addr"),
+                        "slot": f.get("d1"),
+                        "options": f.get("d2"),
+                    }
+                )
+
+        # 2) sample all registered sensors
+        samples = []
+        samp = self.rs485.send_i2c_cmd_multi(addr_int, CMD_SAMPLE_ALL, 0, 0, timeout=1.2)
+        if samp.get("ok"):
+            for f in samp["frames"]:
+                if not f.get("ok") or f.get("status") != 0:
+                    continue
+                val = f.get("d0") | (f.get("d1") << 8) | (f.get("d2") << 16) | (f.get("d3") << 24)
+                samples.append(
+                    {
+                        "sensor_type": f.get("sensor_type"),
+                        "i2c_addr": f.get("i2c_addr"),
+                        "field": f.get("field"),
+                        "value": val,
+                    }
+                )
+
+        # 3) quick scan for any other devices
+        scan = self.rs485.send_i2c_cmd_multi(addr_int, CMD_SCAN_I2C, 0, 0, timeout=0.8)
+        scan_found = []
+        if scan.get("ok"):
+            for f in scan["frames"]:
+                if f.get("ok") and f.get("field") == 0x0E and f.get("status") == 0:
+                    scan_found.append(f.get("i2c_addr"))
+
+        name_map = i2c_catalog.id_to_name_map()
+        for d in devices:
+            try:
+                sid = int(str(d.get("sensor_type", 0)))
+                d["sensor_name"] = name_map.get(sid, f"0x{sid:02x}")
+            except Exception:
+                pass
+        for s in samples:
+            try:
+                sid = int(str(s.get("sensor_type", 0)))
+                s["sensor_name"] = name_map.get(sid, f"0x{sid:02x}")
+            except Exception:
+                pass
+
+        self._set_last_error(module_id, None)
+        return {
+            "ok": True,
+            "comms_ok": True,
+            "module_id": m.id,
+            "type": m.type,
+            "address": m.address_hex,
+            "registered": devices,
+            "samples": samples,
+            "scan_found": scan_found,
+        }
+
     def read_module(self, module_id: str) -> Dict[str, Any]:
         """
         Read and parse a configured module's state (prefers RS485 when enabled, falls back to I2C/dev-mode).
@@ -650,337 +1278,24 @@ class HomeControllerBackend:
         m = self.cfg.modules[idx]
         self._set_last_error(module_id, None)
 
-        addr_key = m.address_hex.lower()
-
         if self._force_rs485 and not self.rs485:
             self._log_module_error(m.type, m.id, m.address_hex, "RS485-only mode but RS485 backend not available")
             return {"ok": False, "error": "RS485-only mode but RS485 backend not available"}
 
-        # Dev-mode: return simulated data if available. If exact address
-        # isn't present in the dev file, fall back to any compatible
-        # simulated entry (useful for quick testing where addresses differ).
-        addr_key = m.address_hex.lower()
         if self._dev_mode:
-            dev = self._dev_data.get(addr_key)
-            # fallback: if no exact match, try to find a compatible dev entry
-            if dev is None:
-                for k, v in self._dev_data.items():
-                    if not isinstance(v, dict):
-                        continue
-                    # AIO entries typically contain 'channels' or 'raw_response'
-                    if m.type == 'aio' and ('raw_response' in v or 'channels' in v):
-                        dev = v
-                        break
-                    # DI/DO entries typically contain gpio_a/gpio_b
-                    if m.type in ('di', 'do') and ('gpio_a' in v or 'gpio_b' in v):
-                        dev = v
-                        break
-
-            if dev is not None:
-                self._set_last_error(module_id, None)
-                # DI/DO simulated via gpio_a/gpio_b or explicit channels
-                if m.type in ("di", "do"):
-                    a = int(dev.get("gpio_a", 0))
-                    b = int(dev.get("gpio_b", 0))
-                    channels: Dict[str, int] = {}
-                    for i in range(8):
-                        channels[str(i + 1)] = 1 if ((a >> i) & 1) else 0
-                    for i in range(8):
-                        channels[str(9 + i)] = 1 if ((b >> i) & 1) else 0
-                    return {
-                        "ok": True,
-                        "comms_ok": True,
-                        "module_id": m.id,
-                        "type": m.type,
-                        "address": m.address_hex,
-                        "ports": {"gpio_a": a, "gpio_b": b},
-                        "channels": channels,
-                        "power": self._sense_info(None, two_lines=True),
-                    }
-                elif m.type == "aio":
-                    # AIO simulated via channels list or raw_response
-                    if "raw_response" in dev:
-                        s = str(dev.get("raw_response", ""))
-                        parts = [p.strip() for p in s.split(",") if p.strip()]
-                        values: List[float] = []
-                        for p in parts:
-                            try:
-                                values.append(float(p))
-                            except Exception:
-                                values.append(float("nan"))
-                    else:
-                        vals = dev.get("channels", [])
-                        values = [float(v) for v in vals]
-
-                    channels: Dict[str, float] = {}
-                    max_ch = min(len(values), 8)
-                    for i in range(max_ch):
-                        channels[str(i + 1)] = values[i]
-
-                    return {
-                        "ok": True,
-                        "comms_ok": True,
-                        "module_id": m.id,
-                        "type": m.type,
-                        "address": m.address_hex,
-                        "raw_response": dev.get("raw_response", ",".join(str(v) for v in values)),
-                        "channels": channels,
-                        "power": self._sense_info(None, two_lines=True),
-                        "comms_led": "green",
-                    }
+            res = self._read_dev(m, module_id)
+            if res is not None:
+                return res
 
         # RS485 path (preferred when enabled)
-        addr_int = m.address_int()
         if self.rs485:
-            try:
-                if m.type == "di":
-                    res = self.rs485.read_di_bitmap(addr_int)
-                    if res.get("ok"):
-                        self._set_last_error(module_id, None)
-                        bm = int(res.get("bitmap", 0))
-                        channels: Dict[str, int] = {}
-                        for i in range(16):
-                            channels[str(i + 1)] = 1 if ((bm >> i) & 1) else 0
-                        return {
-                            "ok": True,
-                            "comms_ok": True,
-                            "module_id": m.id,
-                            "type": m.type,
-                            "address": m.address_hex,
-                            "bitmap": bm,
-                            "sense_mask": res.get("sense_mask"),
-                            "power": self._sense_info(res.get("sense_mask"), two_lines=True),
-                            "comms_led": "green",
-                            "channels": channels,
-                            "raw": {
-                                "lo": res.get("raw_lo"),
-                                "hi": res.get("raw_hi"),
-                            },
-                        }
-                    else:
-                        self._log_module_error(m.type, m.id, m.address_hex, res.get("error", "DI RS485 read failed"), res.get("raw"))
-                        return res
-                elif m.type == "aio":
-                    channels: Dict[str, float] = {}
-                    raw_frames: Dict[str, str] = {}
-                    sense_mask = None
-                    alerts = []
-                    # Read AI channels 0..7 (presented as 1..8 to UI)
-                    for ch in range(8):
-                        r = self.rs485.read_aio_channel(addr_int, ch)
-                        if not r.get("ok"):
-                            self._set_last_error(module_id, r.get("error") or "AIO RS485 read failed")
-                            self._log_module_error(m.type, m.id, m.address_hex, r.get("error", "AIO RS485 read failed"), r.get("raw"))
-                            return r
-                        v12 = int(r.get("value12", 0))
-                        if sense_mask is None:
-                            sense_mask = r.get("sense_mask")
-                        raw_frames[str(ch + 1)] = r.get("raw", b"").hex() if isinstance(r.get("raw"), (bytes, bytearray)) else ""
-                        v = self._counts_to_voltage(v12, m.id, ch + 1, direction="in")
-                        channels[str(ch + 1)] = v
-                        # over-voltage alert
-                        max_cfg = aio_max_voltage.load_aio_max_voltage(m.id)
-                        maxv = None
-                        if max_cfg and "in" in max_cfg and str(ch + 1) in max_cfg["in"]:
-                            try:
-                                maxv = float(max_cfg["in"][str(ch + 1)])
-                            except Exception:
-                                maxv = None
-                        if maxv is not None and v is not None and v > maxv:
-                            alerts.append({
-                                "module": m.id,
-                                "address": m.address_hex,
-                                "channel": ch + 1,
-                                "max_voltage": maxv,
-                                "measured_voltage": v,
-                                "timestamp": int(time.time()),
-                            })
-                    return {
-                        "ok": True,
-                        "comms_ok": True,
-                        "module_id": m.id,
-                        "type": m.type,
-                        "address": m.address_hex,
-                        "channels": channels,
-                        "sense_mask": sense_mask,
-                        "power": self._sense_info(sense_mask, two_lines=True),
-                        "comms_led": "green",
-                        "raw_frames": raw_frames,
-                        "alerts": alerts,
-                    }
-                elif m.type == "do":
-                    res = self.rs485.read_do_bitmap(addr_int)
-                    if res.get("ok"):
-                        self._set_last_error(module_id, None)
-                        bm = int(res.get("bitmap", 0))
-                        channels: Dict[str, int] = {}
-                        for i in range(16):
-                            channels[str(i + 1)] = 1 if ((bm >> i) & 1) else 0
-                        return {
-                            "ok": True,
-                            "comms_ok": True,
-                            "module_id": m.id,
-                            "type": m.type,
-                            "address": m.address_hex,
-                            "bitmap": bm,
-                            "sense_mask": res.get("sense_mask"),
-                            "power": self._sense_info(res.get("sense_mask"), two_lines=True),
-                            "comms_led": "green",
-                            "channels": channels,
-                            "raw": {
-                                "lo": res.get("raw_lo"),
-                                "hi": res.get("raw_hi"),
-                            },
-                        }
-                    else:
-                        self._set_last_error(module_id, res.get("error", "DO RS485 read failed"))
-                        self._log_module_error(m.type, m.id, m.address_hex, res.get("error", "DO RS485 read failed"), res.get("raw"))
-                        return res
-                elif m.type == "Generator":
-                    snap = self.rs485.gen_snapshot(addr_int, trace_logger=self._log_gen_serial)
-                    if not snap.get("ok"):
-                        self._set_last_error(module_id, snap.get("error", "Gen RS485 read failed"))
-                        self._log_module_error(m.type, m.id, m.address_hex, snap.get("error", "Gen RS485 read failed"), snap.get("raw"))
-                        return {"ok": False, "error": snap.get("error", "Gen RS485 read failed")}
-                    t = snap["telem"]
-                    telem = {
-                        "uptime_s": t["uptime_s"],
-                        "battery_v": round(t["batt_mv"] / 1000.0, 3),
-                        "temp_c": round(t["eng_temp_c_x10"] / 10.0, 1),
-                        "gen_v_l1": round(t["gen_v_l1_x10"] / 10.0, 1),
-                        "gen_v_l2": round(t["gen_v_l2_x10"] / 10.0, 1),
-                        "util_v_l1": round(t["util_v_l1_x10"] / 10.0, 1),
-                        "util_v_l2": round(t["util_v_l2_x10"] / 10.0, 1),
-                        "amps_l1": round(t["amps_l1_x100"] / 100.0, 2),
-                        "amps_l2": round(t["amps_l2_x100"] / 100.0, 2),
-                        "hz": round(t["hz_x100"] / 100.0, 2),
-                        "rpm": int(t["rpm"]),
-                        "run_seconds": int(t["run_seconds"]),
-                        "alarm_code": int(t["alarm_code"]),
-                        "warn_code": int(t["warn_code"]),
-                        "state": int(t["state"]),
-                        "mode": int(t["mode"]),
-                        "flags": int(t["flags"]),
-                        "poll_ms": int(t["poll_ms"]),
-                        "good_frames": int(t["good_frames"]),
-                        "bad_frames": int(t["bad_frames"]),
-                    }
-                    state_map = {
-                        0: "UNKNOWN",
-                        1: "STOPPED",
-                        2: "STARTING",
-                        3: "RUNNING",
-                        4: "COOLDOWN",
-                        5: "EXERCISE",
-                        6: "ALARM",
-                        7: "WARNING",
-                    }
-                    mode_map = {0: "UNKNOWN", 1: "OFF", 2: "AUTO", 3: "MANUAL"}
-                    telem["run_state"] = state_map.get(telem["state"], "UNKNOWN")
-                    telem["mode_name"] = mode_map.get(telem["mode"], "UNKNOWN")
-                    running = telem["rpm"] > 0 or telem["state"] == 3
-                    self._set_last_error(module_id, None)
-                    return {
-                        "ok": True,
-                        "comms_ok": True,
-                        "module_id": m.id,
-                        "type": m.type,
-                        "address": m.address_hex,
-                        "running": running,
-                        "run_state": telem["run_state"],
-                        "mode": telem["mode_name"],
-                        "rpm": telem["rpm"],
-                        "hz": telem["hz"],
-                        "battery_v": telem["battery_v"],
-                        "temp_c": telem["temp_c"],
-                        "gen_v_l1": telem["gen_v_l1"],
-                        "gen_v_l2": telem["gen_v_l2"],
-                        "util_v_l1": telem["util_v_l1"],
-                        "util_v_l2": telem["util_v_l2"],
-                        "amps_l1": telem["amps_l1"],
-                        "amps_l2": telem["amps_l2"],
-                        "alarm_code": telem["alarm_code"],
-                        "warn_code": telem["warn_code"],
-                        "raw_telem": telem,
-                    }
-                elif m.type == "i2c":
-                    CMD_SCAN_I2C = 0x05
-                    CMD_LIST_REGISTERED = 0x09
-                    CMD_SAMPLE_ALL = 0x08
-                    # 1) list registered devices
-                    lst = self.rs485.send_i2c_cmd_multi(addr_int, CMD_LIST_REGISTERED, 0, 0, timeout=0.8)
-                    if not lst.get("ok"):
-                        self._set_last_error(module_id, lst.get("error", "I2C module RS485 list failed"))
-                        self._log_module_error(m.type, m.id, m.address_hex, lst.get("error", "I2C module RS485 list failed"), lst.get("raw"))
-                        return {"ok": False, "error": lst.get("error", "I2C module RS485 list failed")}
-                    devices = []
-                    for f in lst["frames"]:
-                        if not f.get("ok"):
-                            continue
-                        if f.get("field") == 0x11 and f.get("status") == 0:  # FIELD_REGISTRY_ENTRY
-                            devices.append(
-                                {
-                                    "sensor_type": f.get("sensor_type"),
-                                    "i2c_addr": f.get("i2c_addr"),
-                                    "slot": f.get("d1"),
-                                    "options": f.get("d2"),
-                                }
-                            )
-
-                    # 2) sample all registered sensors
-                    samples = []
-                    samp = self.rs485.send_i2c_cmd_multi(addr_int, CMD_SAMPLE_ALL, 0, 0, timeout=1.2)
-                    if samp.get("ok"):
-                        for f in samp["frames"]:
-                            if not f.get("ok") or f.get("status") != 0:
-                                continue
-                            val = f.get("d0") | (f.get("d1") << 8) | (f.get("d2") << 16) | (f.get("d3") << 24)
-                            samples.append(
-                                {
-                                    "sensor_type": f.get("sensor_type"),
-                                    "i2c_addr": f.get("i2c_addr"),
-                                    "field": f.get("field"),
-                                    "value": val,
-                                }
-                            )
-
-                    # 3) quick scan for any other devices
-                    scan = self.rs485.send_i2c_cmd_multi(addr_int, CMD_SCAN_I2C, 0, 0, timeout=0.8)
-                    scan_found = []
-                    if scan.get("ok"):
-                        for f in scan["frames"]:
-                            if f.get("ok") and f.get("field") == 0x0E and f.get("status") == 0:
-                                scan_found.append(f.get("i2c_addr"))
-
-                    name_map = i2c_catalog.id_to_name_map()
-                    for d in devices:
-                        try:
-                            sid = int(str(d.get("sensor_type", 0)))
-                            d["sensor_name"] = name_map.get(sid, f"0x{sid:02x}")
-                        except Exception:
-                            pass
-                    for s in samples:
-                        try:
-                            sid = int(str(s.get("sensor_type", 0)))
-                            s["sensor_name"] = name_map.get(sid, f"0x{sid:02x}")
-                        except Exception:
-                            pass
-
-                    self._set_last_error(module_id, None)
-                    return {
-                        "ok": True,
-                        "comms_ok": True,
-                        "module_id": m.id,
-                        "type": m.type,
-                        "address": m.address_hex,
-                        "registered": devices,
-                        "samples": samples,
-                        "scan_found": scan_found,
-                    }
-            except Exception as e:
-                # fall through to legacy I2C path on any RS485 issue
-                self._set_last_error(module_id, str(e))
-                pass
+            handler = self._rs485_readers.get(m.type)
+            if handler is not None:
+                try:
+                    return handler(m, module_id)
+                except Exception as e:
+                    # fall through to legacy I2C path on any RS485 issue
+                    self._set_last_error(module_id, str(e))
 
         if self._force_rs485:
             # RS485 is required; don't attempt I2C fallback
@@ -995,17 +1310,14 @@ class HomeControllerBackend:
 
         if m.type in ("di", "do"):
             try:
-                with smbus2.SMBus(self.cfg.i2c_bus_num) as bus:
-                    a = bus.read_byte_data(m.address_int(), MCP_GPIOA)
-                    b = bus.read_byte_data(m.address_int(), MCP_GPIOB)
+                with self._bus_lock(self.cfg.i2c_bus_num):
+                    bus = self._get_bus(self.cfg.i2c_bus_num)
+                    # GPIOA/GPIOB are adjacent; one block read gets an atomic snapshot
+                    a, b = bus.read_i2c_block_data(m.address_int(), MCP_GPIOA, 2)
                 self._set_last_error(module_id, None)
 
                 # Map bits to channel numbers: 1-8 -> GPIOA bit0..7, 9-16 -> GPIOB bit0..7
-                channels: Dict[str, int] = {}
-                for i in range(8):
-                    channels[str(i + 1)] = 1 if ((a >> i) & 1) else 0
-                for i in range(8):
-                    channels[str(9 + i)] = 1 if ((b >> i) & 1) else 0
+                channels = _unpack_channels(a, b)
 
                 return {
                     "ok": True,
@@ -1019,6 +1331,7 @@ class HomeControllerBackend:
                     "comms_led": "green",
                 }
             except Exception as e:
+                self._drop_bus(self.cfg.i2c_bus_num)
                 self._set_last_error(module_id, f"I2C read error: {e}")
                 return {"ok": False, "error": f"I2C read error: {e}"}
 
@@ -1027,47 +1340,32 @@ class HomeControllerBackend:
             # AIO protocol: write single-byte 0x01 to request status,
             # then device returns an ASCII CSV of voltages (e.g. "1.23,2.34,...").
             try:
-                with smbus2.SMBus(self.cfg.i2c_bus_num) as bus:
-                    # send request byte
-                    try:
-                        bus.write_byte(m.address_int(), 0x01)
-                    except Exception:
-                        # some devices require write_i2c_block_data with no register
-                        try:
-                            bus.write_i2c_block_data(m.address_int(), 0, [])
-                        except Exception:
-                            pass
-
-                    # read up to 128 bytes response
-                    from smbus2 import i2c_msg
-
-                    read_len = 128
-                    msg = i2c_msg.read(m.address_int(), read_len)
-                    bus.i2c_rdwr(msg)
-                    raw = bytes(msg)
-
-                # decode and parse ASCII CSV
+                from smbus2 import i2c_msg
+
+                with self._bus_lock(self.cfg.i2c_bus_num):
+                    bus = self._get_bus(self.cfg.i2c_bus_num)
+                    # request byte + response read in one combined transaction
+                    # (repeated START, no STOP in between)
+                    w = i2c_msg.write(m.address_int(), [0x01])
+                    r = i2c_msg.read(m.address_int(), AIO_READ_LEN)
+                    bus.i2c_rdwr(w, r)
+                    raw = bytes(r)
+
+                # decode and parse the ASCII CSV (malformed fields -> NaN)
                 s = raw.split(b"\x00", 1)[0].decode("utf-8", errors="ignore").strip()
                 if not s:
                     return {"ok": False, "error": "empty response from AIO module"}
 
-                parts = [p.strip() for p in s.split(",") if p.strip()]
-                # parse floats and limit to expected channels (default 8)
-                values: List[float] = []
-                for p in parts:
-                    try:
-                        values.append(float(p))
-                    except Exception:
-                        values.append(float("nan"))
+                values: List[float] = _parse_csv_floats(s)
 
-                channels: Dict[str, float] = {}
                 max_ch = min(len(values), 8)
-                for i in range(max_ch):
-                    channels[str(i + 1)] = values[i]
+                channels = dict(zip(_CH_KEYS_A, values))
 
                 # --- Over-voltage alert logic ---
                 max_cfg = aio_max_voltage.load_aio_max_voltage(m.id)
                 alerts = []
+                # one timestamp per scan: all alerts from the same read share it
+                now_iso = datetime.datetime.now().isoformat()
                 for ch in range(1, max_ch + 1):
                     v = values[ch - 1]
                     maxv = None
@@ -1083,13 +1381,12 @@ class HomeControllerBackend:
                             "channel": ch,
                             "max_voltage": maxv,
                             "measured_voltage": v,
-                            "timestamp": datetime.datetime.now().isoformat(),
+                            "timestamp": now_iso,
                         }
                         alerts.append(alert)
                 if alerts:
                     # Log to a file in config for now
-                    log_path = os.path.join(self._repo_root, "home_controller", "config", "aio_alerts.log")
-                    with open(log_path, "a", encoding="utf-8") as f:
+                    with open(self._alert_log_path, "a", encoding="utf-8") as f:
                         for alert in alerts:
                             f.write(json.dumps(alert) + "\n")
 
@@ -1106,6 +1403,7 @@ class HomeControllerBackend:
                     "alerts": alerts,
                 }
             except Exception as e:
+                self._drop_bus(self.cfg.i2c_bus_num)
                 self._set_last_error(module_id, f"AIO I2C read error: {e}")
                 return {"ok": False, "error": f"AIO I2C read error: {e}"}
 
@@ -1246,16 +1544,9 @@ class HomeControllerBackend:
 
                 dev_out = {"gpio_a": a, "gpio_b": b}
                 self._dev_data[addrk] = dev_out
-                try:
-                    self._save_dev_data()
-                except Exception:
-                    pass
+                self._schedule_dev_save()
 
-                channels: Dict[str, int] = {}
-                for i in range(8):
-                    channels[str(i + 1)] = 1 if ((a >> i) & 1) else 0
-                for i in range(8):
-                    channels[str(9 + i)] = 1 if ((b >> i) & 1) else 0
+                channels = _unpack_channels(a, b)
 
                 return {
                     "ok": True,
@@ -1306,39 +1597,40 @@ class HomeControllerBackend:
             MCP_OLATA = 0x14
             MCP_OLATB = 0x15
 
+            olat_reg = MCP_OLATA if port == "a" else MCP_OLATB
+            MCP_IODIRA = 0x00
+            MCP_IODIRB = 0x01
+            iodir_reg = MCP_IODIRA if port == "a" else MCP_IODIRB
+            shadow = self._mcp_shadow.setdefault(m.address_hex, {})
+
             try:
-                with smbus2.SMBus(self.cfg.i2c_bus_num) as bus:
-                    # try reading OLAT first (output latch), fallback to GPIO
-                    try:
-                        if port == "a":
-                            cur = bus.read_byte_data(m.address_int(), MCP_OLATA)
-                        else:
-                            cur = bus.read_byte_data(m.address_int(), MCP_OLATB)
-                    except Exception:
-                        # fallback
-                        if port == "a":
-                            cur = bus.read_byte_data(m.address_int(), MCP_GPIOA)
-                        else:
-                            cur = bus.read_byte_data(m.address_int(), MCP_GPIOB)
+                with self._bus_lock(self.cfg.i2c_bus_num):
+                    bus = self._get_bus(self.cfg.i2c_bus_num)
+                    # current output latch: shadow first, then OLAT, then GPIO
+                    cur = shadow.get(olat_reg)
+                    if cur is None:
+                        try:
+                            cur = bus.read_byte_data(m.address_int(), olat_reg)
+                        except Exception:
+                            # fallback
+                            gpio_reg = MCP_GPIOA if port == "a" else MCP_GPIOB
+                            cur = bus.read_byte_data(m.address_int(), gpio_reg)
 
                     # ensure the pin is configured as output in IODIR (clear bit)
-                    MCP_IODIRA = 0x00
-                    MCP_IODIRB = 0x01
                     try:
-                        if port == "a":
-                            iodir = bus.read_byte_data(m.address_int(), MCP_IODIRA)
-                        else:
-                            iodir = bus.read_byte_data(m.address_int(), MCP_IODIRB)
+                        iodir = shadow.get(iodir_reg)
+                        if iodir is None:
+                            iodir = bus.read_byte_data(m.address_int(), iodir_reg)
                         # if the bit is set (input) clear it to make output
                         if (iodir >> bit) & 1:
                             new_iodir = iodir & ~(1 << bit)
-                            if port == "a":
-                                bus.write_byte_data(m.address_int(), MCP_IODIRA, new_iodir & 0xFF)
-                            else:
-                                bus.write_byte_data(m.address_int(), MCP_IODIRB, new_iodir & 0xFF)
+                            bus.write_byte_data(m.address_int(), iodir_reg, new_iodir & 0xFF)
+                            shadow[iodir_reg] = new_iodir & 0xFF
+                        else:
+                            shadow[iodir_reg] = iodir & 0xFF
                     except Exception:
                         # best-effort; continue even if IODIR can't be read/written
-                        pass
+                        shadow.pop(iodir_reg, None)
 
                     if int(value) == 1:
                         new = cur | (1 << bit)
@@ -1346,20 +1638,13 @@ class HomeControllerBackend:
                         new = cur & ~(1 << bit)
 
                     # write back to OLAT register to update outputs
-                    if port == "a":
-                        bus.write_byte_data(m.address_int(), MCP_OLATA, new & 0xFF)
-                    else:
-                        bus.write_byte_data(m.address_int(), MCP_OLATB, new & 0xFF)
+                    bus.write_byte_data(m.address_int(), olat_reg, new & 0xFF)
+                    shadow[olat_reg] = new & 0xFF
 
-                    # read back GPIO to provide updated state
-                    a = bus.read_byte_data(m.address_int(), MCP_GPIOA)
-                    b = bus.read_byte_data(m.address_int(), MCP_GPIOB)
+                    # read back GPIO to provide updated state (one block transaction)
+                    a, b = bus.read_i2c_block_data(m.address_int(), MCP_GPIOA, 2)
 
-                channels: Dict[str, int] = {}
-                for i in range(8):
-                    channels[str(i + 1)] = 1 if ((a >> i) & 1) else 0
-                for i in range(8):
-                    channels[str(9 + i)] = 1 if ((b >> i) & 1) else 0
+                channels = _unpack_channels(a, b)
 
                 return {
                     "ok": True,
@@ -1374,6 +1659,9 @@ class HomeControllerBackend:
                 }
 
             except Exception as e:
+                # shadow may no longer match the chip; re-read on next call
+                self._mcp_shadow.pop(m.address_hex, None)
+                self._drop_bus(self.cfg.i2c_bus_num)
                 self._set_last_error(module_id, f"I2C write error: {e}")
                 return {"ok": False, "error": f"I2C write error: {e}"}
 
@@ -1398,27 +1686,21 @@ class HomeControllerBackend:
                 dev = self._dev_data.get(addrk, {}) if isinstance(self._dev_data, dict) else {}
                 chans = [0.0] * 8
                 try:
-                    existing = dev.get("channels", [])
-                    for i, v in enumerate(existing[:8]):
-                        chans[i] = float(v)
+                    existing = dev.get("channels", [])[:8]
+                    chans[: len(existing)] = map(float, existing)
                 except Exception:
-                    pass
+                    chans = [0.0] * 8
 
                 try:
                     chans[ch - 1] = float(voltage)
                 except Exception:
                     pass
 
-                dev_out = {"channels": chans, "raw_response": ",".join(str(v) for v in chans)}
+                dev_out = {"channels": chans, "raw_response": _fmt_chans(tuple(chans))}
                 self._dev_data[addrk] = dev_out
-                try:
-                    self._save_dev_data()
-                except Exception:
-                    pass
+                self._schedule_dev_save()
 
-                channels: Dict[str, float] = {}
-                for i in range(8):
-                    channels[str(i + 1)] = chans[i]
+                channels = dict(zip(_CH_KEYS_A, chans))
 
                 self._set_last_error(module_id, None)
                 return {
@@ -1465,20 +1747,12 @@ class HomeControllerBackend:
             if self._force_rs485:
                 return {"ok": False, "error": self._last_errors.get(module_id) or "RS485 AIO write failed"}
 
-            # Fall back to legacy placeholder if RS485 unavailable
-            s = f"{voltage},{voltage},{voltage},{voltage},{voltage},{voltage},{voltage},{voltage}"
-            parts = [p.strip() for p in s.split(",") if p.strip()]
-            values: List[float] = []
-            for p in parts:
-                try:
-                    values.append(float(p))
-                except Exception:
-                    values.append(float("nan"))
-
-            channels: Dict[str, float] = {}
-            max_ch = min(len(values), 8)
-            for i in range(max_ch):
-                channels[str(i + 1)] = values[i]
+            # Fall back to legacy placeholder if RS485 unavailable: every
+            # lane echoes the requested voltage, so build it directly
+            # instead of round-tripping through a CSV parse
+            v = float(voltage)
+            channels = dict(zip(_CH_KEYS_A, (v,) * 8))
+            s = _fmt_chans((v,) * 8)
 
             return {"ok": True, "module_id": m.id, "type": m.type, "address": m.address_hex, "raw_response": s, "channels": channels}
 
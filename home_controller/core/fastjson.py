@@ -0,0 +1,52 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson parses ~3-10x faster than the stdlib json module and serializes
+faster still; when it is not installed these helpers fall back to the
+stdlib with identical on-disk output semantics. All helpers work in
+bytes (open files in "rb"/"wb") so the orjson path avoids an extra
+encode/decode round-trip.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+import json as _json
+
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return _json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    if _HAS_ORJSON:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return _json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode("utf-8")
+
+
+def load_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path: str, obj: Any, *, indent: bool = True, sort_keys: bool = False) -> None:
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent, sort_keys=sort_keys))
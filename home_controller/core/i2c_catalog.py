@@ -9,16 +9,21 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 CATALOG_CSV = BASE_DIR / "i2c_sensors.csv"
 
+# Parsed-catalog cache keyed on the CSV mtime; the catalog is effectively
+# static per process, so re-reading the file on every request/lookup is
+# pure overhead. Derived maps are cached alongside it.
+_CACHE: Tuple[Optional[int], List[Dict[str, str]]] = (None, [])
+_NAME_MAP: Dict[int, str] = {}
+_ADDR_MAP: Dict[int, str] = {}
 
-def load_catalog() -> List[Dict[str, str]]:
+
+def _read_catalog() -> List[Dict[str, str]]:
     items: List[Dict[str, str]] = []
-    if not CATALOG_CSV.exists():
-        return items
     with open(CATALOG_CSV, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
@@ -28,8 +33,24 @@ def load_catalog() -> List[Dict[str, str]]:
     return items
 
 
+def load_catalog() -> List[Dict[str, str]]:
+    global _CACHE, _NAME_MAP, _ADDR_MAP
+    try:
+        mtime = CATALOG_CSV.stat().st_mtime_ns
+    except OSError:
+        return []
+    if _CACHE[0] != mtime:
+        items = _read_catalog()
+        _CACHE = (mtime, items)
+        _NAME_MAP = {}
+        _ADDR_MAP = {}
+    return _CACHE[1]
+
+
 def id_to_name_map() -> Dict[int, str]:
-    out: Dict[int, str] = {}
+    if load_catalog() and _NAME_MAP:
+        return _NAME_MAP
+    out: Dict[int, str] = _NAME_MAP
     for row in load_catalog():
         try:
             sid = int(str(row.get("id", "0")).strip(), 0)
@@ -41,7 +62,9 @@ def id_to_name_map() -> Dict[int, str]:
 
 
 def id_to_default_addr_map() -> Dict[int, str]:
-    out: Dict[int, str] = {}
+    if load_catalog() and _ADDR_MAP:
+        return _ADDR_MAP
+    out: Dict[int, str] = _ADDR_MAP
     for row in load_catalog():
         try:
             sid = int(str(row.get("id", "0")).strip(), 0)
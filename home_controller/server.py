@@ -1,17 +1,20 @@
 
-import json
+import functools
+import hashlib
 import os
 import re
 import sys
 from pathlib import Path
 import socket
 import subprocess
+import threading
 import time
 from typing import Any, Dict, Optional, Set, Tuple
 # Expansion card settings route
 
 from flask import (
     Flask,
+    Response,
     jsonify,
     request,
     render_template,
@@ -19,9 +22,16 @@ from flask import (
     abort,
 )
 import traceback
+
+# Optional: direct bus probing for scans (falls back to i2cdetect)
+try:
+    import smbus2 as _smbus2
+except Exception:
+    _smbus2 = None  # type: ignore
+
 from home_controller.core.backend import HomeControllerBackend
 from home_controller.config import aio_max_voltage
-from home_controller.core import i2c_catalog
+from home_controller.core import fastjson, i2c_catalog
 
 # ------------------------------------------------------------
 # Paths (absolute, based on this file)
@@ -46,22 +56,83 @@ app = Flask(
     template_folder=str(TEMPLATES_DIR),
     static_folder=str(STATIC_DIR),
 )
+
+# orjson-backed request/response JSON when available: jsonify and
+# request.get_json both go through the app's JSON provider in Flask 2.2+,
+# so every endpoint benefits without changes.
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+except Exception:
+    # stdlib provider is fine when orjson isn't installed
+    pass
+
+# API payloads are machine-consumed: skip key sorting and emit compact
+# JSON (no pretty-print whitespace) regardless of which provider is active.
+app.json.sort_keys = False
+app.json.compact = True
+
+
+def _orjson_response(payload: Any, status: int = 200) -> Response:
+    """Serialize straight to a Response body, bypassing jsonify.
+
+    jsonify still routes through the JSON provider plus Flask's response
+    construction/content-type negotiation; for the endpoints the UI polls
+    every second that indirection is measurable. fastjson keeps the
+    stdlib fallback when orjson isn't installed.
+    """
+    return Response(fastjson.dumps(payload), status=status, mimetype="application/json")
+
+# Jinja tuning: larger compiled-template cache, no per-request mtime
+# checks, and a persistent bytecode cache so compiled templates survive
+# process restarts (cold start / first request get cheaper).
+app.jinja_env.cache_size = 400
+app.jinja_env.auto_reload = False
+try:
+    from jinja2 import FileSystemBytecodeCache
+
+    _jinja_cache_dir = os.getenv("HC_JINJA_CACHE")
+    if _jinja_cache_dir:
+        Path(_jinja_cache_dir).mkdir(parents=True, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache_dir)
+    else:
+        # jinja2's default directory is uid-suffixed and ownership-checked;
+        # a fixed world-writable path would let another local user plant
+        # bytecode for the server to load
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+except Exception:
+    # best-effort; templates still render without the bytecode cache
+    pass
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_i2c_address(addr_str: str) -> int:
+    # pure string -> int, and the UI tends to resubmit the same
+    # spellings, so repeats are a dict hit (errors aren't cached)
     s = (addr_str or "").strip().lower()
     if not s:
         raise ValueError("address is empty")
 
-    if s.startswith("0x"):
-        v = int(s, 16)
-    elif all(c in "0123456789abcdef" for c in s) and any(c in "abcdef" for c in s):
-        # has hex letters => hex
-        v = int(s, 16)
-    elif all(c in "0123456789abcdef" for c in s) and len(s) <= 2:
-        # ambiguous "20" — in I2C land people usually mean hex
+    # 7-bit I2C addresses are effectively always written in hex: "0x20",
+    # "3c", or the ambiguous two-digit "20" (which i2c tooling reads as
+    # hex). Only longer digit-only strings are treated as decimal.
+    if s.startswith("0x") or len(s) <= 2:
         v = int(s, 16)
     else:
-        # decimal
-        v = int(s, 10)
+        try:
+            v = int(s, 10)
+        except ValueError:
+            # has hex letters => hex
+            v = int(s, 16)
 
     if v < 0x03 or v > 0x77:
         raise ValueError(f"address out of 7-bit range: {hex(v)}")
@@ -85,12 +156,48 @@ def _parse_Generator_address(addr_str: str) -> int:
     return v
 
 
-def _scan_i2c_addresses(bus: int, cache_seconds: float = 1.5) -> Tuple[Set[int], Optional[str]]:
+# i2cdetect grid parser: row headers ("20:") hit the first alternative
+# and are skipped; device cells hit the second. "--"/"UU" placeholders
+# and the single-digit column header never match two lowercase hex
+# digits, so one pass over stdout replaces the splitlines/split chain.
+_I2C_GRID_RE = re.compile(r"(?m)^([0-9a-f]{2}):|\b([0-9a-f]{2})\b")
+
+
+def _scan_via_smbus(bus: int) -> Set[int]:
+    """Probe 0x03..0x77 like i2cdetect's auto mode.
+
+    Receive-byte for 0x30-0x37 and 0x50-0x5F (quick-write can be NACKed
+    or upset devices in those ranges — and the AIO modules live in
+    0x30-0x37), write-quick everywhere else.
+    """
+    addrs: Set[int] = set()
+    with _smbus2.SMBus(bus) as b:
+        for addr in range(0x03, 0x78):
+            try:
+                if 0x30 <= addr <= 0x37 or 0x50 <= addr <= 0x5F:
+                    b.read_byte(addr)
+                else:
+                    b.write_quick(addr)
+                addrs.add(addr)
+            except OSError:
+                continue
+    return addrs
+
+
+# Single-scanner lock: concurrent pollers (multiple tabs hitting
+# /modules and /api/gui/modules) shouldn't queue up duplicate bus scans.
+_I2C_SCAN_LOCK = threading.Lock()
+
+
+def _scan_i2c_addresses(bus: int, cache_seconds: float = 10.0) -> Tuple[Set[int], Optional[str]]:
     """
     Returns (set_of_detected_addresses, error_string_or_None)
 
     Uses `i2cdetect -y <bus>` if available.
-    Caches results briefly to avoid hammering the bus.
+    Caches results to avoid hammering the bus; module presence changes
+    rarely, so a stale-for-seconds answer is fine. While one request is
+    scanning, concurrent callers get the last cached result instead of
+    blocking behind it.
     """
     global _I2C_CACHE
 
@@ -98,19 +205,45 @@ def _scan_i2c_addresses(bus: int, cache_seconds: float = 1.5) -> Tuple[Set[int],
         return set(), "I2C disabled (RS485-only mode)"
 
     now = time.time()
-    last_ts, last_addrs, last_err = _I2C_CACHE
+    last_ts, last_addrs, _last_hex, last_err = _I2C_CACHE
     if (now - last_ts) < cache_seconds:
         return set(last_addrs), last_err
 
+    if not _I2C_SCAN_LOCK.acquire(blocking=False):
+        # a scan is already in flight; serve the stale cache
+        return set(last_addrs), last_err
+    try:
+        # re-check under the lock: the in-flight scan may just have finished
+        last_ts, last_addrs, _last_hex, last_err = _I2C_CACHE
+        if (time.time() - last_ts) < cache_seconds:
+            return set(last_addrs), last_err
+        return _scan_i2c_addresses_uncached(bus, now)
+    finally:
+        _I2C_SCAN_LOCK.release()
+
+
+def _scan_i2c_addresses_uncached(bus: int, now: float) -> Tuple[Set[int], Optional[str]]:
+    global _I2C_CACHE
+
     # Ensure device exists (Linux i2c-dev)
     devnode = f"/dev/i2c-{bus}"
     if not Path(devnode).exists():
         err = f"{devnode} not found (enable I2C + i2c-dev on this system)"
-        _I2C_CACHE = (now, set(), err)
+        _I2C_CACHE = (now, set(), set(), err)
         return set(), err
 
+    # Preferred: probe the bus directly (same write-quick technique
+    # i2cdetect uses) without the process spawn and text-grid parse.
+    if _smbus2 is not None:
+        try:
+            addrs = _scan_via_smbus(bus)
+            _I2C_CACHE = (now, set(addrs), {_HEX_STR[a] for a in addrs}, None)
+            return addrs, None
+        except Exception:
+            pass  # fall back to i2cdetect below
+
     try:
-        # i2cdetect output is the most compatible / least dependency approach
+        # i2cdetect fallback: most compatible / least dependency approach
         r = subprocess.run(
             ["i2cdetect", "-y", str(bus)],
             stdout=subprocess.PIPE,
@@ -120,43 +253,60 @@ def _scan_i2c_addresses(bus: int, cache_seconds: float = 1.5) -> Tuple[Set[int],
         )
         if r.returncode != 0:
             err = (r.stderr or r.stdout or "").strip() or "i2cdetect failed"
-            _I2C_CACHE = (now, set(), err)
+            _I2C_CACHE = (now, set(), set(), err)
             return set(), err
 
         addrs: Set[int] = set()
-        for line in (r.stdout or "").splitlines():
-            line = line.strip()
-            # rows look like: "20: -- -- 22 -- -- -- -- --"
-            if len(line) < 3 or ":" not in line:
+        for m in _I2C_GRID_RE.finditer(r.stdout or ""):
+            cell = m.group(2)
+            if cell is None:
                 continue
-            prefix, rest = line.split(":", 1)
-            prefix = prefix.strip()
-            if len(prefix) != 2:
-                continue
-
-            tokens = rest.strip().split()
-            for t in tokens:
-                tt = t.strip().lower()
-                if tt in ("--", "uu"):
-                    continue
-                # actual addresses appear as two hex digits (e.g. '20', '3c')
-                if len(tt) == 2 and all(c in "0123456789abcdef" for c in tt):
-                    addrs.add(int(tt, 16))
+            a = int(cell, 16)
+            if 0x03 <= a <= 0x77:
+                addrs.add(a)
 
-        _I2C_CACHE = (now, set(addrs), None)
+        _I2C_CACHE = (now, set(addrs), {_HEX_STR[a] for a in addrs}, None)
         return addrs, None
 
     except FileNotFoundError:
         err = "i2cdetect not installed (install `i2c-tools`)"
-        _I2C_CACHE = (now, set(), err)
+        _I2C_CACHE = (now, set(), set(), err)
         return set(), err
     except Exception as e:
         err = f"i2c scan error: {e}"
-        _I2C_CACHE = (now, set(), err)
+        _I2C_CACHE = (now, set(), set(), err)
         return set(), err
 
 
+
+def _present_hex_addresses(bus: int) -> Tuple[Set[str], Optional[str]]:
+    """Detected addresses as lowercase "0xNN" strings (cached with the scan)."""
+    addrs, err = _scan_i2c_addresses(bus)
+    _ts, _addrs, hex_set, _err = _I2C_CACHE
+    if len(hex_set) == len(addrs):
+        return hex_set, err
+    return {_HEX_STR[a] for a in addrs}, err
+
+
+# Cached LAN IP: (ts, ip). The address survives for hours; re-probing
+# per head_status request is pure syscall overhead.
+_IP_CACHE: Tuple[float, str] = (0.0, "")
+_IP_CACHE_TTL = 30.0
+
+
 def get_lan_ip() -> str:
+    """Best-effort LAN IP detection, cached for a short TTL."""
+    global _IP_CACHE
+    now = time.time()
+    ts, ip = _IP_CACHE
+    if ip and (now - ts) < _IP_CACHE_TTL:
+        return ip
+    ip = _detect_lan_ip()
+    _IP_CACHE = (now, ip)
+    return ip
+
+
+def _detect_lan_ip() -> str:
     """
     Best-effort LAN IP detection.
     This uses a UDP "connect" trick (no packets required) to learn the outbound interface IP.
@@ -218,7 +368,15 @@ def get_lan_ip() -> str:
     return "0.0.0.0"
 
 
-def internet_ok_tcp() -> bool:
+# Internet reachability, refreshed by a background thread: a failed TCP
+# connect blocks for the full 1.5 s timeout, which would stall every
+# head_status poll if probed inline. (ts, ok); ts == 0.0 means the
+# probe loop hasn't run yet.
+_INTERNET_STATE: Tuple[float, bool] = (0.0, False)
+_INTERNET_PROBE_INTERVAL = 10.0
+
+
+def _probe_internet_once() -> bool:
     """
     More reliable than ping permissions:
     try a TCP connect to 8.8.8.8:53 (DNS).
@@ -229,6 +387,26 @@ def internet_ok_tcp() -> bool:
     except Exception:
         return False
 
+
+def internet_ok_tcp() -> bool:
+    """Latest probe result; only blocks if the loop has never run."""
+    global _INTERNET_STATE
+    ts, ok = _INTERNET_STATE
+    if ts == 0.0:
+        ok = _probe_internet_once()
+        _INTERNET_STATE = (time.time(), ok)
+    return ok
+
+
+def _internet_probe_loop() -> None:
+    global _INTERNET_STATE
+    while True:
+        ok = _probe_internet_once()
+        _INTERNET_STATE = (time.time(), ok)
+        # keep the LAN IP cache warm off the request path too
+        get_lan_ip()
+        time.sleep(_INTERNET_PROBE_INTERVAL)
+
 # ------------------------------------------------------------
 # Per-module config API (invert/override for DI/DO)
 # ------------------------------------------------------------
@@ -372,41 +550,63 @@ def api_set_aio_max_voltage(module_id: str):
     aio_max_voltage.save_aio_max_voltage(m.id, data)
     return jsonify({"ok": True})
 
-# ------------------------------------------------------------
-# Paths (absolute, based on this file)
-# ------------------------------------------------------------
-BASE_DIR = Path(__file__).resolve().parent  # .../home_controller/
-TEMPLATES_DIR = BASE_DIR / "web" / "templates"
-STATIC_DIR = BASE_DIR / "web" / "static"
-
 # UI labels storage (module + channel naming)
 LABELS_DIR = BASE_DIR / "config"
 LABELS_FILE = LABELS_DIR / "ui_labels.json"
 
+# "0xNN" spellings for every 7-bit address, built once so scan-result
+# formatting is a table lookup
+_HEX_STR = tuple(f"0x{a:02x}" for a in range(0x80))
+
 # I2C bus to scan (Pi default is usually 1)
 I2C_BUS = int(os.getenv("HC_I2C_BUS", "1"))
 
+# Hat MCP23017 address; default 0x20 (A0..A2 pulled to GND). Env vars
+# don't change at runtime, so parse once here rather than per request.
+try:
+    HAT_ADDR = int(os.getenv("HC_HAT_ADDR", "0x20"), 0)
+except Exception:
+    HAT_ADDR = 0x20
+
 # Small cache so we don't run i2cdetect constantly
-_I2C_CACHE: Tuple[float, Set[int], Optional[str]] = (0.0, set(), None)  # (ts, addrs, err)
+# (ts, addrs, addrs_hex, err); the formatted-hex view is cached with the
+# scan so callers never rebuild the "0x%02x" strings per request
+_I2C_CACHE: Tuple[float, Set[int], Set[str], Optional[str]] = (0.0, set(), set(), None)
+
+
+# Parsed ui_labels.json keyed on mtime; labels are read on every GUI
+# render but only change when the user renames something.
+_labels_cache: Tuple[int, dict] = (-1, {})
 
 
 def _load_labels() -> dict:
+    global _labels_cache
     try:
-        if not LABELS_FILE.exists():
-            return {}
-        with open(LABELS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
+        st = LABELS_FILE.stat()
+    except OSError:
+        return {}
+    if st.st_mtime_ns == _labels_cache[0]:
+        return _labels_cache[1]
+    try:
+        data = fastjson.loads(LABELS_FILE.read_bytes())
+        data = data if isinstance(data, dict) else {}
     except Exception:
         return {}
+    _labels_cache = (st.st_mtime_ns, data)
+    return data
 
 
 def _save_labels(data: dict) -> None:
+    global _labels_cache
     LABELS_DIR.mkdir(parents=True, exist_ok=True)
     tmp = LABELS_FILE.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    tmp.write_bytes(fastjson.dumps(data, indent=True, sort_keys=True))
     tmp.replace(LABELS_FILE)
+    # refresh the cache so the next load skips the disk entirely
+    try:
+        _labels_cache = (LABELS_FILE.stat().st_mtime_ns, data)
+    except OSError:
+        _labels_cache = (-1, {})
 
 
 # ------------------------------------------------------------
@@ -432,8 +632,7 @@ def _load_Generator_contacts() -> Dict[str, Any]:
     try:
         if not Generator_CONTACTS_FILE.exists():
             return _default_Generator_contacts()
-        with open(Generator_CONTACTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = fastjson.loads(Generator_CONTACTS_FILE.read_bytes())
         if not isinstance(data, dict):
             return _default_Generator_contacts()
         if "contacts" not in data or not isinstance(data["contacts"], list):
@@ -447,8 +646,7 @@ def _save_Generator_contacts(data: Dict[str, Any]) -> None:
     try:
         Generator_CONTACTS_FILE.parent.mkdir(parents=True, exist_ok=True)
         tmp = Generator_CONTACTS_FILE.with_suffix(".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        tmp.write_bytes(fastjson.dumps(data, indent=True, sort_keys=True))
         tmp.replace(Generator_CONTACTS_FILE)
     except Exception:
         pass
@@ -588,14 +786,21 @@ def _startup_module_check():
     if RS485_ONLY or getattr(backend, "_force_rs485", False):
         print("[INFO] RS485-only mode; skipping I2C presence scan.")
         return
-    addrs, _err = _scan_i2c_addresses(I2C_BUS)
-    present_hex = {f"0x{a:02x}" for a in addrs}
+    if DEV_MODE:
+        print("[INFO] Dev mode; skipping I2C presence scan.")
+        return
+    if not backend.list_modules():
+        # fresh install: nothing to check, so don't block startup on a
+        # bus scan (i2cdetect can take a couple of seconds)
+        print("[INFO] No modules configured; skipping I2C presence scan.")
+        return
+    present_hex, _err = _present_hex_addresses(I2C_BUS)
     missing = []
     for m in backend.list_modules():
         # Generator is not on the I2C bus; skip presence check
         if m.type == "Generator":
             continue
-        if m.address_hex.lower() not in present_hex:
+        if m.address_hex not in present_hex:
             missing.append(m)
     if missing:
         print("[WARNING] The following modules are configured but not detected on the I2C bus:")
@@ -608,16 +813,64 @@ def _startup_module_check():
 _startup_module_check()
 
 
+def _warm_templates():
+    # Compile every template at startup so the first request per page
+    # doesn't pay the Jinja compile (the persistent bytecode cache above
+    # makes this mostly a cache load after the first boot).
+    try:
+        for name in app.jinja_env.list_templates(filter_func=lambda n: n.endswith(".html")):
+            app.jinja_env.get_template(name)
+    except Exception as e:
+        print(f"[WARN] template warm-up failed: {e}")
+
+
+_warm_templates()
+
+threading.Thread(target=_internet_probe_loop, daemon=True).start()
+
+
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
+_NOCACHE_HEADERS = (
+    ("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0"),
+    ("Pragma", "no-cache"),
+    ("Expires", "0"),
+)
+
+# Rate-limited traceback logging: a flaky module polled by the GUI can
+# raise the same exception several times a second, and formatting and
+# printing the full stack for each repeat just floods stderr. The same
+# (type, message) signature only logs its stack once per window.
+_TB_SEEN: Dict[Tuple[type, str], float] = {}
+_TB_WINDOW = 5.0
+
+
+def _log_exception(e: BaseException) -> Optional[str]:
+    """Print the stack unless this error was just logged; returns the
+    formatted trace for API payloads in dev mode, else None."""
+    now = time.monotonic()
+    sig = (type(e), str(e))
+    last = _TB_SEEN.get(sig)
+    if last is None or (now - last) >= _TB_WINDOW:
+        # evict expired signatures before inserting: error messages can
+        # embed module ids/addresses, so a storm of varying errors would
+        # otherwise grow the map without bound
+        expired = [k for k, ts in _TB_SEEN.items() if (now - ts) >= _TB_WINDOW]
+        for k in expired:
+            del _TB_SEEN[k]
+        _TB_SEEN[sig] = now
+        traceback.print_exc()
+    return traceback.format_exc() if DEV_MODE else None
+
+
 @app.after_request
 def _no_cache_for_api(resp):
-    # Prevent stale head/IP/network/I2C status in the browser
-    if request.path.startswith("/api/") or request.path == "/":
-        resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-        resp.headers["Pragma"] = "no-cache"
-        resp.headers["Expires"] = "0"
+    # Prevent stale head/IP/network/I2C status in the browser; runs on
+    # every response, so one path fetch and one bulk header extend
+    p = request.path
+    if p == "/" or p.startswith("/api/"):
+        resp.headers.extend(_NOCACHE_HEADERS)
     return resp
 
 @app.get("/")
@@ -626,7 +879,6 @@ def root():
     try:
         return render_template("index.html")
     except Exception as e:
-        import traceback
         print("[UI ERROR] Could not render index.html:", e)
         traceback.print_exc()
         # fallback to JSON health if template rendering fails
@@ -659,7 +911,7 @@ def ui_add():
 # ------------------------------------------------------------
 @app.get("/api/i2c_scan")
 def api_i2c_scan():
-    return jsonify({
+    return _orjson_response({
         "addresses": [],
         "error": None,
         "ts": int(time.time()),
@@ -673,7 +925,9 @@ def api_i2c_scan():
 def modules_list():
     out = []
     for m in backend.list_modules():
-        addr_hex = str(m.address_hex).lower().strip()
+        # address_hex is normalized (stripped lowercase "0xNN") at config
+        # load and on add/change, so no per-request cleanup is needed
+        addr_hex = m.address_hex
         out.append(
             {
                 "id": m.id,
@@ -685,7 +939,7 @@ def modules_list():
                 "last_error": backend.get_last_error(m.id),
             }
         )
-    return jsonify(out)
+    return _orjson_response(out)
 
 
 @app.get("/modules/Generator/<module_id>/detail")
@@ -901,9 +1155,10 @@ def modules_set_number():
 # Labels API
 # ------------------------------------------------------------
 @app.get("/labels/<module_id>")
-def labels_get(module_id: str):
+def labels_get(module_id: str, _load_labels=_load_labels, _jsonify=jsonify):
+    # polled per GUI tile; globals pre-bound as defaults (LOAD_FAST)
     labels = _load_labels()
-    return jsonify({"ok": True, "module_id": module_id, "labels": labels.get(module_id, {})})
+    return _jsonify({"ok": True, "module_id": module_id, "labels": labels.get(module_id, {})})
 
 
 @app.post("/labels/set")
@@ -937,11 +1192,11 @@ def labels_set():
 # ------------------------------------------------------------
 # Serve module SVGs
 # ------------------------------------------------------------
-@app.get("/modules/svg/<module_type>")
-def module_svg(module_type: str):
-    module_type = (module_type or "").strip().lower()
-
-    svg_map = {
+# type -> (resolved svg dir, filename); built once so the route is a
+# dict hit plus send_from_directory (which 404s on missing files itself)
+_SVG_MAP = {
+    mtype: (str(BASE_DIR / "modules" / folder), filename)
+    for mtype, (folder, filename) in {
         "di": ("di", "DI.svg"),
         "do": ("do", "DO.svg"),
         "aio": ("aio", "AIO.svg"),
@@ -951,18 +1206,33 @@ def module_svg(module_type: str):
         "i2c_expander": ("i2c", "I2C_EXPANDER.svg"),
         "rs485": ("rs485", "RS485_MODULE.svg"),
         "generator": ("Generator", "Generator.svg"),
-    }
+    }.items()
+}
 
-    if module_type not in svg_map:
-        abort(404)
 
-    folder, filename = svg_map[module_type]
-    svg_dir = BASE_DIR / "modules" / folder
+# SVGs are static per deployment: read them once, hash for an ETag and
+# serve from memory with an aggressive cache policy. type -> (bytes, etag)
+_SVG_CACHE: Dict[str, Tuple[bytes, str]] = {}
+for _mtype, (_dir, _fname) in _SVG_MAP.items():
+    try:
+        _buf = (Path(_dir) / _fname).read_bytes()
+        _SVG_CACHE[_mtype] = (_buf, hashlib.blake2b(_buf, digest_size=12).hexdigest())
+    except OSError:
+        pass
+del _mtype, _dir, _fname
+
 
-    if not (svg_dir / filename).exists():
+@app.get("/modules/svg/<module_type>")
+def module_svg(module_type: str):
+    hit = _SVG_CACHE.get((module_type or "").strip().lower())
+    if hit is None:
         abort(404)
-
-    return send_from_directory(str(svg_dir), filename, mimetype="image/svg+xml")
+    buf, etag = hit
+    resp = Response(buf, mimetype="image/svg+xml")
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    # answers If-None-Match with a bodyless 304
+    return resp.make_conditional(request)
 
 
 # ------------------------------------------------------------
@@ -973,7 +1243,7 @@ def head_status():
     ip = get_lan_ip()
     online = internet_ok_tcp()
 
-    return jsonify(
+    return _orjson_response(
         {
             "server_running": True,
             "internet_ok": bool(online),
@@ -1041,25 +1311,34 @@ def api_module_errors_inject():
 # ------------------------------------------------------------
 # GUI helpers API
 # ------------------------------------------------------------
+# GUI channel counts per module type: (inputs, outputs)
+_CHANNEL_COUNTS = {"di": (16, 0), "do": (0, 16), "aio": (8, 8)}
+
+
+def _head_first(m) -> int:
+    return 0 if m.type == "head" else 1
+
+
 @app.get("/api/gui/modules")
-def api_gui_modules():
+def api_gui_modules(_bk=backend, _resp=_orjson_response):
     """Return ordered modules for GUI: head (if any) then slots 1..N.
 
     Each entry includes slot number, id, type, name, address, present,
     and channel counts for in/out so the UI can build controls.
+    Hot path for the GUI poller, so the globals it touches are
+    pre-bound as defaults.
     """
+    backend = _bk
     mods = backend.list_modules()
-    # prefer head first if present
-    head = [m for m in mods if m.type == "head"]
-    others = [m for m in mods if m.type != "head"]
-    ordered = head + others
+    # prefer head first if present (stable sort, single pass)
+    ordered = sorted(mods, key=_head_first)
 
     if RS485_ONLY:
         # Assume present in RS485-only mode; RS485 comms/health checks will surface actual faults.
-        present = {m.address_hex.lower() for m in ordered}
+        present = {m.address_hex for m in ordered}
     else:
-        addrs, _err = _scan_i2c_addresses(I2C_BUS)
-        present = {f"0x{a:02x}" for a in addrs}
+        present, _err = _present_hex_addresses(I2C_BUS)
+        present = set(present)
         # If running in dev mode, treat addresses found in dev data as present too
         try:
             if backend._dev_mode:
@@ -1070,28 +1349,16 @@ def api_gui_modules():
 
     out = []
     for i, m in enumerate(ordered, start=1):
-        mtype = m.type
-        if mtype == "di":
-            ch_in = 16
-            ch_out = 0
-        elif mtype == "do":
-            ch_in = 0
-            ch_out = 16
-        elif mtype == "aio":
-            ch_in = 8
-            ch_out = 8
-        else:
-            ch_in = 0
-            ch_out = 0
-
+        ch_in, ch_out = _CHANNEL_COUNTS.get(m.type, (0, 0))
+        addr_hex = m.address_hex
         out.append(
             {
                 "slot": i,
                 "id": m.id,
-                "type": mtype,
+                "type": m.type,
                 "name": m.name,
-                "address": m.address_hex,
-                "present": m.address_hex.lower() in present,
+                "address": addr_hex,
+                "present": addr_hex in present,
                 "channels_in": ch_in,
                 "channels_out": ch_out,
                 "module_num": m.module_num,
@@ -1099,7 +1366,7 @@ def api_gui_modules():
             }
         )
 
-    return jsonify(out)
+    return _resp(out)
 
 
 @app.post("/api/gui/action")
@@ -1120,9 +1387,11 @@ def api_gui_action():
             res = backend.read_module(module_id)
             return jsonify(res)
         except Exception as e:
-            tb = traceback.format_exc()
-            print(tb)
-            return jsonify({"ok": False, "error": str(e), "trace": tb}), 400
+            tb = _log_exception(e)
+            body = {"ok": False, "error": str(e)}
+            if tb:
+                body["trace"] = tb
+            return jsonify(body), 400
 
     elif action == "write":
         try:
@@ -1151,9 +1420,11 @@ def api_gui_action():
             res = backend.write_module(module_id=module_id, channel=channel, value=value)
             return jsonify(res)
         except Exception as e:
-            tb = traceback.format_exc()
-            print(tb)
-            return jsonify({"ok": False, "error": str(e), "trace": tb}), 400
+            tb = _log_exception(e)
+            body = {"ok": False, "error": str(e)}
+            if tb:
+                body["trace"] = tb
+            return jsonify(body), 400
 
     else:
         return jsonify({"ok": False, "error": "unknown action"}), 400
@@ -1173,18 +1444,8 @@ def ui_gui():
 # ------------------------------------------------------------
 @app.get("/api/hat_status")
 def api_hat_status():
-    # default address: 0x20 (A0..A2 pulled to GND)
     try:
-        addr_env = os.getenv("HC_HAT_ADDR", "0x20")
-        if isinstance(addr_env, str) and addr_env.startswith("0x"):
-            addr = int(addr_env, 16)
-        else:
-            addr = int(addr_env, 0)
-    except Exception:
-        addr = 0x20
-
-    try:
-        res = backend.read_hat_status(bus_num=0, address=addr)
+        res = backend.read_hat_status(bus_num=0, address=HAT_ADDR)
         return jsonify(res)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
@@ -1261,4 +1522,15 @@ if __name__ == "__main__":
     print('Registered routes:')
     for rule in app.url_map.iter_rules():
         print(rule)
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        app.run(host=host, port=port, debug=True)
+    else:
+        # Prefer a production WSGI server over the single-threaded Werkzeug
+        # dev server; the GUI polls several endpoints per second.
+        try:
+            from waitress import serve
+
+            serve(app, host=host, port=port, threads=4)
+        except ImportError:
+            print("[WARN] waitress not installed; falling back to the Flask dev server")
+            app.run(host=host, port=port, debug=False)